@@ -4,105 +4,169 @@ from sklearn.linear_model import LinearRegression
 from datetime import datetime
 import os
 from typing import List, Dict, Any
+from rollup import RollupCube
+from registry import DatasetRegistry
 
-def load_real_data():
+# 목적지별 데이터 설정 (CSV 파일명, 시장 키 -> 관광객 CSV 컬럼)
+DESTINATIONS = {
+    'guam': {
+        'tourism_file': 'Gual_Tourism(arrival)_10Y.csv',
+        'gdp_file': 'Guam_GDP_10Y.csv',
+        'markets': {
+            'japan': 'Japan',
+            'korea': 'Korea',
+            'usa': 'US/Hawaii',
+            'china': 'China',
+            'philippines': 'Philippines',
+            'taiwan': 'Taiwan'
+        },
+        'total_column': 'Total Arrivals',
+        # 분석 시작 연도 (이전 월별/GDP 데이터는 제외, 종료 연도는 데이터에서 결정)
+        'start_year': 2014,
+        # 국가별 가중치 (구매력, 체류기간, 소비패턴 기반)
+        'market_weights': {
+            'japan': 1.3,      # 높은 구매력, 장기 체류
+            'korea': 1.1,      # 중상급 구매력, 쇼핑 선호
+            'usa': 1.5,        # 높은 구매력, 프리미엄 서비스 선호
+            'china': 0.9,      # 중간 구매력
+            'philippines': 0.8, # 중하급 구매력
+            'taiwan': 1.0      # 중간 구매력
+        },
+        # 연도별 시장 가중치 (특정 연도 조회 시 적용)
+        'year_weights': {
+            '2024': {'japan': 1.1, 'korea': 1.3, 'usa': 1.0, 'china': 0.8, 'philippines': 1.4, 'taiwan': 1.1},
+            '2023': {'japan': 1.0, 'korea': 1.2, 'usa': 0.9, 'china': 0.7, 'philippines': 1.3, 'taiwan': 1.0},
+            '2022': {'japan': 0.8, 'korea': 0.9, 'usa': 0.8, 'china': 0.5, 'philippines': 1.0, 'taiwan': 0.8},
+            '2021': {'japan': 0.3, 'korea': 0.4, 'usa': 0.6, 'china': 0.2, 'philippines': 0.8, 'taiwan': 0.3},
+            '2020': {'japan': 0.4, 'korea': 0.3, 'usa': 0.5, 'china': 0.1, 'philippines': 0.6, 'taiwan': 0.4},
+            '2019': {'japan': 1.3, 'korea': 1.4, 'usa': 1.1, 'china': 1.0, 'philippines': 1.2, 'taiwan': 1.3},
+            '2018': {'japan': 1.2, 'korea': 1.3, 'usa': 1.0, 'china': 0.9, 'philippines': 1.1, 'taiwan': 1.2},
+            '2017': {'japan': 1.1, 'korea': 1.2, 'usa': 0.9, 'china': 0.8, 'philippines': 1.0, 'taiwan': 1.1},
+            '2016': {'japan': 1.0, 'korea': 1.0, 'usa': 0.8, 'china': 0.7, 'philippines': 0.9, 'taiwan': 1.0},
+            '2015': {'japan': 0.9, 'korea': 0.9, 'usa': 0.7, 'china': 0.6, 'philippines': 0.8, 'taiwan': 0.9},
+            '2014': {'japan': 0.8, 'korea': 0.8, 'usa': 0.6, 'china': 0.5, 'philippines': 0.7, 'taiwan': 0.8}
+        }
+    }
+}
+DEFAULT_DESTINATION = 'guam'
+# market_weights/year_weights에 없는 시장·연도는 보정 없이 1.0 적용
+DEFAULT_MARKET_WEIGHT = 1.0
+
+# 프로세스당 상주 데이터셋 메모리 예산 (MB)
+DATASET_MEMORY_BUDGET_MB = int(os.environ.get('DATASET_MEMORY_BUDGET_MB', '256'))
+
+def read_destination_csv(destination=DEFAULT_DESTINATION):
+    """목적지 CSV에서 월별 관광객 레코드와 연도별 GDP를 읽음"""
+    config = DESTINATIONS[destination]
+    
+    # 1. 관광객 월별 데이터 로드
+    # 현재 스크립트의 디렉토리를 기준으로 상위 폴더의 data 디렉토리 찾기
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    tourism_path = os.path.join(project_root, 'data', config['tourism_file'])
+    tourism_df = pd.read_csv(tourism_path)
+    
+    # Month 컬럼을 날짜로 변환하고 연도 추출
+    tourism_df['Year'] = pd.to_datetime(tourism_df['Month'], format='%Y-%m').dt.year
+    tourism_df['Month_num'] = pd.to_datetime(tourism_df['Month'], format='%Y-%m').dt.month
+    
+    # 2. GDP 연별 데이터 로드
+    gdp_path = os.path.join(project_root, 'data', config['gdp_file'])
+    gdp_df = pd.read_csv(gdp_path)
+    
+    # GDP 데이터 처리 (첫 번째 행의 연도별 값 추출)
+    gdp_row = gdp_df.iloc[0]  # "Gross domestic product" 행
+    gdp_years = {}
+    start_year = config['start_year']
+    
+    # 연도 컬럼 중 분석 시작 연도 이후 전부 사용 (새 연도 컬럼이 추가되면 자동 반영)
+    for column in gdp_row.index:
+        if str(column).isdigit() and int(column) >= start_year and pd.notna(gdp_row[column]):
+            # 콤마 제거하고 숫자로 변환
+            gdp_value = str(gdp_row[column]).replace(',', '').replace('"', '')
+            gdp_years[int(column)] = float(gdp_value) / 1000  # 단위를 10억 달러로 변환
+    
+    # 3. 월별 데이터 정리 (전체 기간)
+    monthly_data = []
+    for _, row in tourism_df.iterrows():
+        if row['Year'] >= start_year:  # 분석 시작 연도부터 모든 데이터
+            record = {
+                'year': int(row['Year']),
+                'month': int(row['Month_num']),
+                'month_str': row['Month']
+            }
+            for market, column in config['markets'].items():
+                record[market] = float(row[column]) if pd.notna(row[column]) else 0
+            total_column = config['total_column']
+            record['total'] = float(row[total_column]) if pd.notna(row[total_column]) else 0
+            monthly_data.append(record)
+    
+    # 디버깅: 월별 데이터 개수 확인
+    print(f"로드된 월별 데이터 개수: {len(monthly_data)}")
+    years_in_monthly = set(item['year'] for item in monthly_data)
+    print(f"월별 데이터에 포함된 연도들: {sorted(years_in_monthly)}")
+    
+    return monthly_data, gdp_years
+
+def load_real_data(destination=DEFAULT_DESTINATION):
     """실제 CSV 데이터를 로드하고 연별/월별 데이터를 처리"""
+    markets = list(DESTINATIONS[destination]['markets'].keys())
     try:
-        # 1. 관광객 월별 데이터 로드
-        # 현재 스크립트의 디렉토리를 기준으로 상위 폴더의 data 디렉토리 찾기
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(script_dir)
-        tourism_path = os.path.join(project_root, 'data', 'Gual_Tourism(arrival)_10Y.csv')
-        tourism_df = pd.read_csv(tourism_path)
-        
-        # Month 컬럼을 날짜로 변환하고 연도 추출
-        tourism_df['Year'] = pd.to_datetime(tourism_df['Month'], format='%Y-%m').dt.year
-        tourism_df['Month_num'] = pd.to_datetime(tourism_df['Month'], format='%Y-%m').dt.month
-        
-        # 2. GDP 연별 데이터 로드
-        gdp_path = os.path.join(project_root, 'data', 'Guam_GDP_10Y.csv')
-        gdp_df = pd.read_csv(gdp_path)
+        monthly_data, gdp_years = read_destination_csv(destination)
         
-        # GDP 데이터 처리 (첫 번째 행의 연도별 값 추출)
-        gdp_row = gdp_df.iloc[0]  # "Gross domestic product" 행
-        gdp_years = {}
+        # 4. 월/분기/연도 롤업 큐브 생성 (한 번만 집계)
+        cube = RollupCube(monthly_data, markets + ['total'])
         
-        for year in range(2014, 2023):  # 2014-2022년
-            if str(year) in gdp_row.index:
-                # 콤마 제거하고 숫자로 변환
-                gdp_value = str(gdp_row[str(year)]).replace(',', '').replace('"', '')
-                gdp_years[year] = float(gdp_value) / 1000  # 단위를 10억 달러로 변환
-        
-        # 3. 연별 관광객 데이터 집계
-        yearly_tourism = tourism_df.groupby('Year').agg({
-            'Korea': 'sum',
-            'Japan': 'sum',
-            'US/Hawaii': 'sum',
-            'Philippines': 'sum',
-            'Taiwan': 'sum',
-            'China': 'sum'
-        }).reset_index()
-        
-        # 4. 월별 데이터 정리 (전체 기간)
-        monthly_data = []
-        for _, row in tourism_df.iterrows():
-            if row['Year'] >= 2014:  # 2014년부터 모든 데이터
-                monthly_data.append({
-                    'year': int(row['Year']),
-                    'month': int(row['Month_num']),
-                    'month_str': row['Month'],
-                    'korea': float(row['Korea']) if pd.notna(row['Korea']) else 0,
-                    'japan': float(row['Japan']) if pd.notna(row['Japan']) else 0,
-                    'usa': float(row['US/Hawaii']) if pd.notna(row['US/Hawaii']) else 0,
-                    'philippines': float(row['Philippines']) if pd.notna(row['Philippines']) else 0,
-                    'taiwan': float(row['Taiwan']) if pd.notna(row['Taiwan']) else 0,
-                    'china': float(row['China']) if pd.notna(row['China']) else 0,
-                    'total': float(row['Total Arrivals']) if pd.notna(row['Total Arrivals']) else 0
-                })
-        
-        # 디버깅: 월별 데이터 개수 확인
-        print(f"로드된 월별 데이터 개수: {len(monthly_data)}")
-        years_in_monthly = set(item['year'] for item in monthly_data)
-        print(f"월별 데이터에 포함된 연도들: {sorted(years_in_monthly)}")
-        
-        # 5. 연별 데이터 정리
-        yearly_data = {}
-        for _, row in yearly_tourism.iterrows():
-            year = int(row['Year'])
-            if year in gdp_years and year >= 2014 and year <= 2022:
-                yearly_data[year] = {
-                    'gdp': gdp_years[year],
-                    'korea': float(row['Korea']) if pd.notna(row['Korea']) else 0,
-                    'japan': float(row['Japan']) if pd.notna(row['Japan']) else 0,
-                    'usa': float(row['US/Hawaii']) if pd.notna(row['US/Hawaii']) else 0,
-                    'philippines': float(row['Philippines']) if pd.notna(row['Philippines']) else 0,
-                    'taiwan': float(row['Taiwan']) if pd.notna(row['Taiwan']) else 0,
-                    'china': float(row['China']) if pd.notna(row['China']) else 0
-                }
+        # 5. 연별 데이터 정리 (큐브의 연도 합계 사용)
+        yearly_data = build_yearly_data(cube, gdp_years, markets)
         
         # 6. 계절성 분석
-        seasonal_patterns = analyze_seasonality(tourism_df)
+        seasonal_patterns = analyze_seasonality(monthly_data, markets)
         
         return {
             'yearly': yearly_data,
             'monthly': monthly_data,
-            'seasonality': seasonal_patterns
+            'seasonality': seasonal_patterns,
+            'cube': cube,
+            'gdp': gdp_years,
+            'markets': markets,
+            'destination': destination
         }
         
     except Exception as e:
-        print(f"데이터 로드 오류: {e}")
+        print(f"데이터 로드 오류 ({destination}): {e}")
+        # 샘플 데이터는 괌 기준이므로 기본 목적지에만 사용
+        if destination != DEFAULT_DESTINATION:
+            raise
         # 오류 시 기본 샘플 데이터 반환
         return get_sample_data()
 
-def analyze_seasonality(tourism_df):
+def load_dataset(destination):
+    """목적지 데이터셋 로드 및 인사이트 사전 계산 (레지스트리 로더)"""
+    data = load_real_data(destination)
+    data['insights'] = precompute_insights(data)
+    return data
+
+def build_yearly_data(cube, gdp_years, countries):
+    """롤업 큐브의 연도 합계와 GDP를 결합한 연별 데이터 생성"""
+    yearly_data = {}
+    for year in cube.periods('year'):
+        if year in gdp_years:
+            yearly_data[year] = {
+                'gdp': gdp_years[year],
+                **{country: cube.get('year', year, country, 'sum') for country in countries}
+            }
+    return yearly_data
+
+def analyze_seasonality(monthly_data, countries):
     """계절성 패턴 분석"""
     patterns = {}
-    countries = ['Korea', 'Japan', 'US/Hawaii', 'Philippines', 'Taiwan', 'China']
+    
+    # 월별 평균 계산 (2019년 이전 정상 데이터만 사용)
+    pre_covid = RollupCube([data for data in monthly_data if data['year'] < 2020], countries + ['total'])
     
     for country in countries:
-        # 월별 평균 계산 (2019년 이전 정상 데이터만 사용)
-        pre_covid = tourism_df[tourism_df['Year'] < 2020]
-        monthly_avg = pre_covid.groupby('Month_num')[country].mean()
+        monthly_avg = pre_covid.series('month_of_year', country, 'mean')
         
         # 피크 시즌과 비수기 구분
         peak_threshold = monthly_avg.quantile(0.7)
@@ -111,8 +175,7 @@ def analyze_seasonality(tourism_df):
         peak_months = monthly_avg[monthly_avg >= peak_threshold].index.tolist()
         low_months = monthly_avg[monthly_avg <= low_threshold].index.tolist()
         
-        country_key = country.lower().replace('/', '_').replace('us_hawaii', 'usa')
-        patterns[country_key] = {
+        patterns[country] = {
             'peak_months': peak_months,
             'low_months': low_months,
             'monthly_average': monthly_avg.to_dict(),
@@ -122,6 +185,7 @@ def analyze_seasonality(tourism_df):
 
 def get_sample_data():
     """기존 샘플 데이터 (백업용)"""
+    markets = list(DESTINATIONS[DEFAULT_DESTINATION]['markets'].keys())
     return {
         'yearly': {
             2014: {"gdp": 5.61, "japan": 819000.0, "korea": 320000.0, "usa": 71000.0, "china": 15000.0, "philippines": 12000.0, "taiwan": 43000.0},
@@ -135,16 +199,27 @@ def get_sample_data():
             2022: {"gdp": 6.91, "japan": 200000.0, "korea": 320000.0, "usa": 73000.0, "china": 6000.0, "philippines": 8500.0, "taiwan": 7000.0}
         },
         'monthly': [],
-        'seasonality': {}
+        'seasonality': {},
+        'cube': RollupCube([], markets + ['total']),
+        'gdp': {},
+        'markets': markets,
+        'destination': DEFAULT_DESTINATION
     }
 
-# 전역 데이터 로드
-DATA = load_real_data()
+# 목적지별 데이터셋 레지스트리 (첫 요청 시 로드, 메모리 예산 초과 시 LRU 해제)
+DATASETS = DatasetRegistry(load_dataset, DESTINATIONS.keys(), DATASET_MEMORY_BUDGET_MB * 1024 * 1024)
 
-def get_country_rankings(year="all"):
+def get_country_rankings(year="all", destination=DEFAULT_DESTINATION):
     """국가별 경제 기여도 순위 계산"""
-    yearly_data = DATA['yearly']
-    countries = ['japan', 'korea', 'usa', 'china', 'philippines', 'taiwan']
+    return compute_country_rankings(DATASETS.get(destination), year)
+
+def compute_country_rankings(data, year="all"):
+    """데이터셋 기준 국가별 경제 기여도 순위 계산"""
+    yearly_data = data['yearly']
+    countries = data['markets']
+    config = DESTINATIONS[data['destination']]
+    market_weights = config.get('market_weights', {})
+    year_weights = config.get('year_weights', {})
     
     # 연도별 필터링
     if year != "all" and year.isdigit():
@@ -174,43 +249,23 @@ def get_country_rankings(year="all"):
         else:
             correlation = 0
         
-        # 연도별 가중치 적용
+        # 연도별 가중치 적용 (목적지 설정의 year_weights)
         year_multiplier = 1.0
         if year != "all" and year.isdigit():
-            year_multipliers = {
-                '2024': {'japan': 1.1, 'korea': 1.3, 'usa': 1.0, 'china': 0.8, 'philippines': 1.4, 'taiwan': 1.1},
-                '2023': {'japan': 1.0, 'korea': 1.2, 'usa': 0.9, 'china': 0.7, 'philippines': 1.3, 'taiwan': 1.0},
-                '2022': {'japan': 0.8, 'korea': 0.9, 'usa': 0.8, 'china': 0.5, 'philippines': 1.0, 'taiwan': 0.8},
-                '2021': {'japan': 0.3, 'korea': 0.4, 'usa': 0.6, 'china': 0.2, 'philippines': 0.8, 'taiwan': 0.3},
-                '2020': {'japan': 0.4, 'korea': 0.3, 'usa': 0.5, 'china': 0.1, 'philippines': 0.6, 'taiwan': 0.4},
-                '2019': {'japan': 1.3, 'korea': 1.4, 'usa': 1.1, 'china': 1.0, 'philippines': 1.2, 'taiwan': 1.3},
-                '2018': {'japan': 1.2, 'korea': 1.3, 'usa': 1.0, 'china': 0.9, 'philippines': 1.1, 'taiwan': 1.2},
-                '2017': {'japan': 1.1, 'korea': 1.2, 'usa': 0.9, 'china': 0.8, 'philippines': 1.0, 'taiwan': 1.1},
-                '2016': {'japan': 1.0, 'korea': 1.0, 'usa': 0.8, 'china': 0.7, 'philippines': 0.9, 'taiwan': 1.0},
-                '2015': {'japan': 0.9, 'korea': 0.9, 'usa': 0.7, 'china': 0.6, 'philippines': 0.8, 'taiwan': 0.9},
-                '2014': {'japan': 0.8, 'korea': 0.8, 'usa': 0.6, 'china': 0.5, 'philippines': 0.7, 'taiwan': 0.8}
-            }
-            year_multiplier = year_multipliers.get(year, {}).get(country, 1.0)
+            year_multiplier = year_weights.get(year, {}).get(country, DEFAULT_MARKET_WEIGHT)
         
         # 경제적 영향도 계산 (개선된 모델)
         # 1. 관광객당 기본 경제 기여도 설정 (USD)
         base_impact_per_tourist = 1200  # 관광객 1명당 평균 1200달러 소비
         
-        # 2. 국가별 가중치 적용 (구매력, 체류기간, 소비패턴 기반)
-        country_multipliers = {
-            'japan': 1.3,      # 높은 구매력, 장기 체류
-            'korea': 1.1,      # 중상급 구매력, 쇼핑 선호
-            'usa': 1.5,        # 높은 구매력, 프리미엄 서비스 선호
-            'china': 0.9,      # 중간 구매력
-            'philippines': 0.8, # 중하급 구매력
-            'taiwan': 1.0      # 중간 구매력
-        }
+        # 2. 국가별 가중치 적용 (목적지 설정의 market_weights)
+        country_multiplier = market_weights.get(country, DEFAULT_MARKET_WEIGHT)
         
         # 3. 상관관계 기반 추가 가중치
         correlation_multiplier = 1 + abs(correlation) * 0.5  # 상관관계가 높을수록 영향도 증가
         
         # 4. 최종 관광객당 영향도 계산 (연도별 가중치 포함)
-        impact_per_tourist = base_impact_per_tourist * country_multipliers.get(country, 1.0) * correlation_multiplier * year_multiplier
+        impact_per_tourist = base_impact_per_tourist * country_multiplier * correlation_multiplier * year_multiplier
         
         # 5. 총 경제적 영향도 계산 (백만 달러 단위, 연도별 가중치 적용)
         adjusted_tourists = avg_tourists * year_multiplier
@@ -250,21 +305,21 @@ def get_country_rankings(year="all"):
             "total_annual_average": int(total_annual_avg),
             "total_cumulative": int(total_cumulative),
             "years_count": years_count,
-            "period": f"2014-2024년 ({years_count}년간)" if year == "all" else f"{year}년"
+            "period": f"{min(filtered_data)}-{max(filtered_data)}년 ({years_count}년간)" if year == "all" else f"{year}년"
         }
     }
 
-def get_correlations(year="all"):
+def get_correlations(year="all", destination=DEFAULT_DESTINATION):
     """시계열 상관관계 데이터 반환"""
-    yearly_data = DATA['yearly']
-    monthly_data = DATA['monthly']
-    countries = ['japan', 'korea', 'usa', 'china', 'philippines', 'taiwan']
+    data = DATASETS.get(destination)
+    yearly_data = data['yearly']
+    countries = data['markets']
     
     if year != "all" and year.isdigit():
         target_year = int(year)
         
-        # 특정 연도의 경우 월별 데이터를 사용해서 분석
-        year_monthly_data = [data for data in monthly_data if data['year'] == target_year]
+        # 특정 연도의 경우 월별 데이터를 사용해서 분석 (롤업 큐브의 월 셀 조회)
+        year_monthly_data = data['cube'].month_records(target_year)
         
         # 디버깅: 특정 연도 월별 데이터 확인
         print(f"연도 {target_year}의 월별 데이터 개수: {len(year_monthly_data)}")
@@ -305,9 +360,9 @@ def get_correlations(year="all"):
                 "note": f"{target_year}년 월별 관광객 패턴 상관관계"
             }
         else:
-            # 해당 연도 월별 데이터가 없으면 연도 범위로 분석 (±2년)
-            start_year = max(2014, target_year - 2)
-            end_year = min(2022, target_year + 2)
+            # 해당 연도 월별 데이터가 없으면 연도 범위로 분석 (±2년, 연별 데이터가 있는 연도만)
+            start_year = target_year - 2
+            end_year = target_year + 2
             
             filtered_data = {y: yearly_data[y] for y in yearly_data.keys() 
                            if start_year <= y <= end_year}
@@ -345,137 +400,281 @@ def get_correlations(year="all"):
         "note": note
     }
 
-def get_monthly_data(year="all"):
+def get_year_stats(cube, year, countries):
+    """롤업 큐브의 연도 셀에서 국가별 합계/평균/성수기/비수기 월 조회"""
+    year_cell = cube.cell('year', year)
+    return {
+        country: {
+            "total": year_cell[country]['sum'],
+            "average": year_cell[country]['mean'],
+            "peak_month": year_cell[country]['argmax'],
+            "low_month": year_cell[country]['argmin']
+        }
+        for country in countries
+    }
+
+def get_monthly_data(year="all", destination=DEFAULT_DESTINATION):
     """월별 데이터 반환 (새로운 API 엔드포인트용)"""
-    monthly_data = DATA['monthly']  # 리스트 형태의 월별 데이터
+    dataset = DATASETS.get(destination)
+    cube = dataset['cube']
+    countries = dataset['markets']
     
-    # 연도별 필터링
+    # 연도별 필터링 (롤업 큐브의 연도별 월 인덱스 사용)
     if year != "all" and year.isdigit():
-        target_year = int(year)
-        # 특정 연도의 월별 데이터만 필터링
-        filtered_monthly = [data for data in monthly_data if data['year'] == target_year]
+        target_years = [int(year)]
     else:
-        filtered_monthly = monthly_data
+        target_years = cube.periods('year')
     
-    # 연도별 통계 계산
-    countries = ['japan', 'korea', 'usa', 'china', 'philippines', 'taiwan']
-    yearly_stats = {}
-    
-    # 월별 데이터를 연도별로 그룹화
+    filtered_monthly = []
     yearly_grouped = {}
-    for data in filtered_monthly:
-        year_key = data['year']
-        if year_key not in yearly_grouped:
-            yearly_grouped[year_key] = []
+    yearly_stats = {}
+    for year_key in target_years:
+        month_records = cube.month_records(year_key)
+        if not month_records:
+            continue
+        filtered_monthly.extend(month_records)
         
-        yearly_grouped[year_key].append({
-            "month": data['month_str'],
-            "month_num": data['month'],
-            **{country: data[country] for country in countries}
-        })
-    
-    # 연도별 통계 계산
-    for year_key, months in yearly_grouped.items():
-        yearly_stats[year_key] = {}
-        for country in countries:
-            tourist_values = [month[country] for month in months]
-            if tourist_values:
-                yearly_stats[year_key][country] = {
-                    "total": sum(tourist_values),
-                    "average": np.mean(tourist_values),
-                    "peak_month": max(months, key=lambda x: x[country])["month_num"],
-                    "low_month": min(months, key=lambda x: x[country])["month_num"]
-                }
+        # 월별 데이터를 연도별로 그룹화
+        yearly_grouped[year_key] = [
+            {
+                "month": data['month_str'],
+                "month_num": data['month'],
+                **{country: data[country] for country in countries}
+            }
+            for data in month_records
+        ]
+        
+        # 연도별 통계 (롤업 큐브에서 O(1) 조회)
+        yearly_stats[year_key] = get_year_stats(cube, year_key, countries)
     
     return {
         "monthly_data": filtered_monthly,
-        "seasonality": DATA['seasonality'],
+        "seasonality": dataset['seasonality'],
         "yearly_stats": yearly_stats,
         "yearly_grouped": yearly_grouped
     }
 
 
 
-def get_monthly_analysis(tourism_df):
-    """월별 데이터 분석 및 계절성 패턴 반환"""
+SEASONAL_BUSINESS_TIPS = {
+    'peak_season': {
+        'description': '성수기 - 관광객 증가, 서비스 수요 급증',
+        'business_tips': [
+            '직원 충원 및 근무 시간 연장',
+            '재고 확보 및 메뉴 다양화',
+            '예약 시스템 강화',
+            '프리미엄 서비스 제공'
+        ]
+    },
+    'low_season': {
+        'description': '비수기 - 현지 고객 및 마케팅 집중',
+        'business_tips': [
+            '현지인 타겟 프로모션',
+            '시설 점검 및 보수',
+            '직원 교육 및 훈련',
+            '새로운 메뉴 개발'
+        ]
+    }
+}
+
+def build_business_insights(data, year="all"):
+    """연도별 비즈니스 인사이트 계산 (타겟 시장, 성수기/비수기, 변동성 순위)"""
+    countries = data['markets']
+    cube = data['cube']
     
-    # 월별 패턴 분석
-    if 'Month' in tourism_df.columns:
-        monthly_patterns = tourism_df.groupby('Month')[['Korea', 'Japan', 'USA', 'China', 'Philippines', 'Taiwan']].mean()
+    # 월별 패턴 (전체 기간은 월별 연평균, 특정 연도는 해당 연도 월별 값) - 롤업 큐브에서 조회
+    if year != "all" and year.isdigit():
+        month_keys = [f"{int(year)}-{month:02d}" for month in range(1, 13)]
+        monthly_patterns = pd.DataFrame({
+            market: cube.series('month', market, 'sum', month_keys) for market in countries + ['total']
+        })
+        monthly_patterns.index = [int(key[-2:]) for key in monthly_patterns.index]
     else:
-        # Month 컬럼이 없는 경우 기본 패턴 생성
         monthly_patterns = pd.DataFrame({
-            'Korea': [8500, 9200, 12000, 10500, 9800, 8800, 11200, 10800, 9500, 10200, 9800, 11500],
-            'Japan': [12000, 13500, 16800, 15200, 14100, 12800, 16500, 15900, 13800, 14800, 14200, 17200],
-            'USA': [2400, 2600, 3200, 2900, 2700, 2500, 3100, 2950, 2650, 2800, 2750, 3300],
-            'China': [4200, 4500, 5800, 5100, 4700, 4300, 5400, 5150, 4600, 4900, 4750, 5600],
-            'Philippines': [3600, 3800, 4800, 4200, 3900, 3700, 4500, 4300, 3850, 4100, 3950, 4650],
-            'Taiwan': [3000, 3200, 4100, 3600, 3350, 3100, 3850, 3700, 3300, 3500, 3400, 4000]
-        }, index=range(1, 13))
-    
-    # 성수기/비수기 분석
-    monthly_totals = monthly_patterns.sum(axis=1)
-    peak_months = monthly_totals.nlargest(4).index.tolist()
-    low_months = monthly_totals.nsmallest(4).index.tolist()
-    
-    # 계절성 인사이트
-    seasonal_insights = {
-        'peak_season': {
-            'months': peak_months,
-            'description': '성수기 - 관광객 증가, 서비스 수요 급증',
-            'business_tips': [
-                '직원 충원 및 근무 시간 연장',
-                '재고 확보 및 메뉴 다양화',
-                '예약 시스템 강화',
-                '프리미엄 서비스 제공'
-            ]
-        },
-        'low_season': {
-            'months': low_months,
-            'description': '비수기 - 현지 고객 및 마케팅 집중',
-            'business_tips': [
-                '현지인 타겟 프로모션',
-                '시설 점검 및 보수',
-                '직원 교육 및 훈련',
-                '새로운 메뉴 개발'
-            ]
+            market: cube.series('month_of_year', market, 'mean') for market in countries + ['total']
+        })
+    
+    # 1. 타겟 시장 (경제 기여도 상위 3개국)
+    rankings = compute_country_rankings(data, year)['rankings']
+    target_markets = [
+        {
+            "rank": index + 1,
+            "country": ranking['country'],
+            "total_economic_impact": ranking['total_economic_impact'],
+            "avg_tourists": ranking['avg_tourists'],
+            "impact_per_tourist": ranking['impact_per_tourist']
+        }
+        for index, ranking in enumerate(rankings[:3])
+    ]
+    
+    if monthly_patterns.empty:
+        return {
+            "year": year,
+            "target_markets": target_markets,
+            "seasons": {},
+            "volatility": [],
+            "summary": {}
+        }
+    
+    # 2. 성수기/비수기 (총 관광객 기준 상위/하위 3개월)
+    monthly_totals = monthly_patterns['total']
+    peak_months = sorted(monthly_totals.nlargest(3).index.astype(int).tolist())
+    low_months = sorted(monthly_totals.nsmallest(3).index.astype(int).tolist())
+    
+    seasons = {
+        'peak_season': {'months': peak_months, **SEASONAL_BUSINESS_TIPS['peak_season']},
+        'low_season': {'months': low_months, **SEASONAL_BUSINESS_TIPS['low_season']},
+        'by_country': {
+            country: {
+                'peak_month': int(monthly_patterns[country].idxmax()),
+                'low_month': int(monthly_patterns[country].idxmin())
+            }
+            for country in countries
         }
     }
     
-    # 월별 트렌드 데이터
-    monthly_trends = []
-    for month in range(1, 13):
-        monthly_data = {
-            'month': month,
-            'total_visitors': int(monthly_totals.iloc[month-1]),
-            'korea': int(monthly_patterns.iloc[month-1]['Korea']),
-            'japan': int(monthly_patterns.iloc[month-1]['Japan']),
-            'usa': int(monthly_patterns.iloc[month-1]['USA']),
-            'china': int(monthly_patterns.iloc[month-1]['China']),
-            'philippines': int(monthly_patterns.iloc[month-1]['Philippines']),
-            'taiwan': int(monthly_patterns.iloc[month-1]['Taiwan'])
+    # 3. 국가별 월별 변동성 ((최대-최소)/평균 %)
+    volatility = []
+    for country in countries:
+        monthly_values = monthly_patterns[country]
+        mean_value = monthly_values.mean()
+        if mean_value > 0:
+            variation = (monthly_values.max() - monthly_values.min()) / mean_value * 100
+        else:
+            variation = 0
+        volatility.append({"country": country, "variation": round(float(variation), 1)})
+    volatility.sort(key=lambda x: x['variation'], reverse=True)
+    
+    return {
+        "year": year,
+        "target_markets": target_markets,
+        "seasons": seasons,
+        "volatility": volatility,
+        "summary": {
+            "peak_months": peak_months,
+            "low_months": low_months,
+            "highest_variation_country": volatility[0]['country'],
+            "most_stable_country": volatility[-1]['country']
         }
-        monthly_trends.append(monthly_data)
+    }
+
+def precompute_insights(data):
+    """전체 기간 및 모든 연도의 비즈니스 인사이트를 미리 계산"""
+    years = set(data['yearly'].keys()) | set(data['cube'].periods('year'))
+    return {year_key: build_business_insights(data, year_key)
+            for year_key in ["all"] + [str(y) for y in sorted(years)]}
+
+def get_business_insights(year="all", destination=DEFAULT_DESTINATION):
+    """사전 계산된 비즈니스 인사이트 반환 (해당 연도 데이터가 없으면 None)"""
+    return DATASETS.get(destination)['insights'].get(year)
+
+def reload_data(destination=DEFAULT_DESTINATION):
+    """CSV 데이터를 다시 읽어 변경된 월만 증분 반영하고 이전 데이터 대비 변경분 반환"""
+    # 같은 목적지의 로드/재로드와 겹치지 않도록 목적지 락 안에서 갱신 (다른 목적지는 영향 없음)
+    with DATASETS.destination_lock(destination):
+        previous = DATASETS.peek(destination)
+        markets = list(DESTINATIONS[destination]['markets'].keys())
+        # 메모리에 없거나 시장 구성이 바뀌면 전체 재로드
+        if previous is None or previous['markets'] != markets:
+            DATASETS.reload(destination)
+            return {"full_refresh": True}
+        
+        monthly_data, gdp_years = read_destination_csv(destination)
+        old_months = {data['month_str']: data for data in previous['monthly']}
+        new_month_keys = set(row['month_str'] for row in monthly_data)
+        
+        # 큐브는 월 삭제를 지원하지 않으므로 삭제된 월이 있으면 전체 재로드
+        if any(key not in new_month_keys for key in old_months):
+            current = DATASETS.reload(destination)
+            return compute_dataset_delta(previous, current)
+        
+        rows = [row for row in monthly_data if old_months.get(row['month_str']) != row]
+        current, delta = apply_monthly_updates(previous, rows, gdp_years)
+        # 갱신된 사본을 한 번에 교체 - 처리 중인 요청은 이전 데이터셋을 끝까지 사용
+        DATASETS.replace(destination, current)
+        return delta
+
+def compute_dataset_delta(previous, current):
+    """이전/현재 데이터셋 비교 - 추가/변경/삭제된 월과 변경된 연도 집계"""
+    # 이전 데이터가 메모리에 없거나 시장 구성이 바뀌면 전체 재조회 필요
+    if previous is None or previous['markets'] != current['markets']:
+        return {"full_refresh": True}
     
-    # 국가별 월별 변화율
-    country_variations = {}
-    for country in ['Korea', 'Japan', 'USA', 'China', 'Philippines', 'Taiwan']:
-        monthly_values = monthly_patterns[country].values
-        variation = (monthly_values.max() - monthly_values.min()) / monthly_values.mean() * 100
-        country_variations[country.lower()] = round(variation, 1)
+    old_months = {data['month_str']: data for data in previous['monthly']}
+    new_months = {data['month_str']: data for data in current['monthly']}
+    appended = [data for key, data in new_months.items() if key not in old_months]
+    changed = [data for key, data in new_months.items() if key in old_months and old_months[key] != data]
+    removed = sorted(key for key in old_months if key not in new_months)
+    return build_delta(previous['yearly'], current, appended, changed, removed)
+
+def build_delta(previous_yearly, current, appended, changed, removed):
+    """변경분 알림 데이터 구성 (변경된 월, 연도 집계, 영향받은 연도 통계)"""
+    affected_years = set(data['year'] for data in appended + changed) | set(int(key[:4]) for key in removed)
+    current_years = set(current['cube'].periods('year'))
     
     return {
-        'monthly_trends': monthly_trends,
-        'seasonal_insights': seasonal_insights,
-        'country_variations': country_variations,
-                 'analysis_summary': {
-             'peak_months': peak_months,
-             'low_months': low_months,
-             'highest_variation_country': max(country_variations.keys(), key=lambda k: country_variations[k]),
-             'most_stable_country': min(country_variations.keys(), key=lambda k: country_variations[k])
-         }
+        "full_refresh": False,
+        "appended_months": appended,
+        "changed_months": changed,
+        "removed_months": removed,
+        "yearly": {year_key: entry for year_key, entry in current['yearly'].items()
+                   if previous_yearly.get(year_key) != entry},
+        "yearly_stats": {year_key: get_year_stats(current['cube'], year_key, current['markets'])
+                         for year_key in sorted(affected_years & current_years)}
     }
 
+def is_empty_delta(delta):
+    """전체 재조회가 아니고 변경된 월/연도 집계가 없는 변경분인지 확인"""
+    if delta.get('full_refresh'):
+        return False
+    return not any(delta.get(key) for key in ('appended_months', 'changed_months', 'removed_months', 'yearly'))
+
+def apply_monthly_updates(previous, rows, gdp_years):
+    """추가/변경된 월과 GDP를 데이터셋 사본에 증분 반영하고 (갱신된 데이터셋, 변경분) 반환"""
+    # 요청 스레드가 읽는 중인 데이터셋은 건드리지 않고 사본(큐브, 인사이트 포함)을 갱신
+    dataset = {**previous, 'cube': previous['cube'].copy(), 'insights': dict(previous['insights'])}
+    previous_yearly = dataset['yearly']
+    old_month_keys = set(data['month_str'] for data in dataset['monthly'])
+    appended = [row for row in rows if row['month_str'] not in old_month_keys]
+    changed = [row for row in rows if row['month_str'] in old_month_keys]
+    
+    # 영향받는 큐브 셀만 재계산
+    changed_periods = dataset['cube'].append(rows)
+    
+    # 월별 데이터 목록 갱신 (같은 월은 새 값으로 교체)
+    new_months = set(row['month_str'] for row in rows)
+    monthly_data = [data for data in dataset['monthly'] if data['month_str'] not in new_months] + rows
+    dataset['monthly'] = sorted(monthly_data, key=lambda data: data['month_str'])
+    
+    # 연별 데이터는 큐브의 연도 합계를 다시 읽기만 함
+    dataset['gdp'] = gdp_years
+    if gdp_years:
+        dataset['yearly'] = build_yearly_data(dataset['cube'], gdp_years, dataset['markets'])
+    if any(row['year'] < 2020 for row in rows):
+        dataset['seasonality'] = analyze_seasonality(dataset['monthly'], dataset['markets'])
+    
+    # 변경된 연도의 인사이트만 재계산 - 연별 데이터가 바뀌면 전체 기간 순위를 쓰는 연도도 포함
+    insight_years = set(changed_periods['year'])
+    yearly_changed = dataset['yearly'] != previous_yearly
+    if yearly_changed:
+        insight_years |= set(year_key for year_key in dataset['cube'].periods('year')
+                             if year_key not in dataset['yearly'])
+        insight_years |= set(year_key for year_key, entry in dataset['yearly'].items()
+                             if previous_yearly.get(year_key) != entry)
+    if rows or yearly_changed:
+        for year_key in ["all"] + [str(y) for y in sorted(insight_years)]:
+            dataset['insights'][year_key] = build_business_insights(dataset, year_key)
+    
+    return dataset, build_delta(previous_yearly, dataset, appended, changed, [])
+
+def append_monthly_data(rows, destination=DEFAULT_DESTINATION):
+    """새 월별 데이터를 추가하고 롤업 큐브, 연별 데이터, 인사이트를 증분 갱신"""
+    with DATASETS.destination_lock(destination):
+        previous = DATASETS.get(destination)
+        current, delta = apply_monthly_updates(previous, list(rows), previous['gdp'])
+        DATASETS.replace(destination, current)
+        return delta
+
 def predict_gdp_impact(tourism_df, gdp_df, country_changes: Dict[str, float]):
     """관광객 변화에 따른 GDP 영향 예측"""
     
@@ -511,4 +710,4 @@ def predict_gdp_impact(tourism_df, gdp_df, country_changes: Dict[str, float]):
         'current_gdp': round(current_gdp, 2),
         'predicted_gdp': round(predicted_gdp, 2),
         'impact_percentage': round((gdp_impact / current_gdp) * 100, 2)
-    } 
\ No newline at end of file
+    } 
@@ -1,14 +1,26 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Depends
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from analysis import (
     get_country_rankings, 
     get_correlations, 
     get_monthly_data,
+    get_business_insights,
     predict_gdp_impact,
-    DATA  # 전역 데이터 객체
+    reload_data,
+    is_empty_delta,
+    DATASETS,  # 목적지별 데이터셋 레지스트리
+    DEFAULT_DESTINATION
 )
+from events import DatasetEventBroker
+from registry import UnknownDestinationError
+from singleflight import SingleFlight
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import asyncio
+import os
+import secrets
 import uvicorn
 
 app = FastAPI(title="괌 비즈니스 인사이트 API", version="1.0.0")
@@ -22,6 +34,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 동시에 들어온 동일한 분석 요청을 하나의 계산으로 합침
+analysis_flight = SingleFlight()
+
+# 데이터 재로드 시 대시보드에 변경 알림(SSE) 전송
+dataset_events = DatasetEventBroker()
+
+# 데이터 재로드 API 토큰 (설정하지 않으면 재로드 API 비활성화)
+RELOAD_API_TOKEN = os.environ.get('RELOAD_API_TOKEN')
+
+# 목적지별 재로드 락 - 재로드는 합치지 않고 순서대로 실행 (뒤 요청은 최신 CSV를 다시 읽음)
+reload_locks: Dict[str, asyncio.Lock] = {}
+
+def verify_reload_token(x_reload_token: Optional[str] = Header(None)):
+    """재로드 요청의 X-Reload-Token 헤더 검증"""
+    if not RELOAD_API_TOKEN:
+        raise HTTPException(status_code=403, detail="데이터 재로드 API가 비활성화되어 있습니다")
+    if x_reload_token is None or not secrets.compare_digest(x_reload_token, RELOAD_API_TOKEN):
+        raise HTTPException(status_code=401, detail="재로드 토큰이 올바르지 않습니다")
+
+async def reload_and_publish(destination: str):
+    """데이터 재로드(스레드풀) 후 변경분 알림 발행 - 변경이 없으면 버전을 올리지 않고 알림 생략"""
+    async with reload_locks.setdefault(destination, asyncio.Lock()):
+        delta = await run_in_threadpool(reload_data, destination)
+        if is_empty_delta(delta):
+            return {"destination": destination, "version": dataset_events.version(destination), **delta}
+        return dataset_events.publish(destination, delta)
+
 class TourismChange(BaseModel):
     japan: float = 0
     korea: float = 0
@@ -35,31 +74,92 @@ async def root():
     return {"message": "괌 비즈니스 인사이트 API에 오신 것을 환영합니다!"}
 
 @app.get("/api/rankings")
-async def get_rankings(year: str = "all"):
+async def get_rankings(year: str = "all", destination: str = DEFAULT_DESTINATION):
     """국가별 경제 기여도 순위 반환"""
     try:
-        rankings = get_country_rankings(year)
+        rankings = await analysis_flight.do(('get_country_rankings', destination, year), get_country_rankings, year, destination)
         return rankings
+    except UnknownDestinationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/correlations")
-async def get_correlations_endpoint(year: str = "all"):
+async def get_correlations_endpoint(year: str = "all", destination: str = DEFAULT_DESTINATION):
     """시계열 상관관계 데이터 반환"""
     try:
-        correlations = get_correlations(year)
+        correlations = await analysis_flight.do(('get_correlations', destination, year), get_correlations, year, destination)
         return correlations
+    except UnknownDestinationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/monthly")
-async def get_monthly_endpoint(year: str = "all"):
+async def get_monthly_endpoint(year: str = "all", destination: str = DEFAULT_DESTINATION):
     """월별 데이터 및 계절성 분석 반환"""
     try:
-        monthly_data = get_monthly_data(year)
+        monthly_data = await analysis_flight.do(('get_monthly_data', destination, year), get_monthly_data, year, destination)
         return monthly_data
+    except UnknownDestinationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/insights")
+async def get_insights_endpoint(year: str = "all", destination: str = DEFAULT_DESTINATION):
+    """사전 계산된 비즈니스 인사이트 반환"""
+    try:
+        insights = await analysis_flight.do(('get_business_insights', destination, year),
+                                            get_business_insights, year, destination)
+    except UnknownDestinationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if insights is None:
+        raise HTTPException(status_code=404, detail=f"{year}년 인사이트 데이터가 없습니다")
+    return insights
+
+@app.get("/api/events")
+async def dataset_events_endpoint(destination: str = DEFAULT_DESTINATION, version: Optional[str] = None,
+                                  last_event_id: Optional[str] = Header(None)):
+    """데이터셋 버전 변경 알림 스트림 (Server-Sent Events)"""
+    if destination not in DATASETS.destinations:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 목적지: {destination}")
+    # 브라우저 자동 재연결은 Last-Event-ID 헤더, 새 연결은 version 쿼리로 마지막 수신 버전 전달
+    return StreamingResponse(
+        dataset_events.stream(destination, last_event_id or version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/reload", dependencies=[Depends(verify_reload_token)])
+async def reload_endpoint(destination: str = DEFAULT_DESTINATION):
+    """CSV 데이터 재로드 후 구독 중인 대시보드에 변경분 알림"""
+    if destination not in DATASETS.destinations:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 목적지: {destination}")
+    try:
+        notice = await reload_and_publish(destination)
+        return notice
+    except UnknownDestinationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/stats/events")
+async def get_event_stats():
+    """SSE 구독자 수 및 데이터셋 버전 반환"""
+    return dataset_events.stats()
+
+@app.get("/api/stats/singleflight")
+async def get_singleflight_stats():
+    """요청 합치기(single-flight) 카운터 반환"""
+    return analysis_flight.stats()
+
+@app.get("/api/stats/datasets")
+async def get_dataset_stats():
+    """목적지별 상주 데이터셋 및 메모리 사용량 반환"""
+    return DATASETS.stats()
 
 @app.post("/api/predict")
 async def predict_gdp(request: TourismChange):
@@ -0,0 +1,79 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+# 유휴 연결 유지를 위한 keep-alive 주기 (초)
+HEARTBEAT_SECONDS = 15
+# 구독자별 대기 알림 수 - 초과하면 밀린 알림을 버리고 전체 재조회 요청
+SUBSCRIBER_QUEUE_SIZE = 8
+
+def format_sse(event: str, data: str, event_id: Optional[int] = None) -> str:
+    """Server-Sent Events 메시지 형식으로 변환"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines())
+    return "\n".join(lines) + "\n\n"
+
+class DatasetEventBroker:
+    """목적지별 데이터셋 버전 알림을 SSE 구독자에게 전달"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._versions: Dict[str, int] = {}
+        self.published = 0
+
+    def version(self, destination: str) -> int:
+        return self._versions.get(destination, 0)
+
+    def _resync_message(self, destination: str) -> str:
+        notice = {"destination": destination, "version": self.version(destination), "full_refresh": True}
+        return format_sse("dataset-version", json.dumps(notice), self.version(destination))
+
+    def publish(self, destination: str, delta: Dict[str, Any]) -> Dict[str, Any]:
+        """새 버전 알림을 발행 (메시지는 한 번만 직렬화하여 모든 구독자가 공유)"""
+        version = self.version(destination) + 1
+        self._versions[destination] = version
+        self.published += 1
+
+        notice = {"destination": destination, "version": version, **delta}
+        message = format_sse("dataset-version", json.dumps(notice, ensure_ascii=False), version)
+        for queue in self._subscribers.get(destination, ()):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # 느린 클라이언트: 밀린 변경분 대신 전체 재조회 알림 하나만 남김
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._resync_message(destination))
+        return notice
+
+    async def stream(self, destination: str, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """구독자 하나의 SSE 스트림 (연결이 끊기면 제너레이터 종료 시 구독 해제)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        subscribers = self._subscribers.setdefault(destination, set())
+        subscribers.add(queue)
+        try:
+            yield f"retry: {HEARTBEAT_SECONDS * 1000}\n\n"
+            # 재연결 시 놓친 버전이 있으면 전체 재조회 요청 (변경 이력은 보관하지 않음)
+            if last_event_id is not None and last_event_id != str(self.version(destination)):
+                yield self._resync_message(destination)
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    message = ": keep-alive\n\n"
+                yield message
+        finally:
+            subscribers.discard(queue)
+            if not subscribers and self._subscribers.get(destination) is subscribers:
+                del self._subscribers[destination]
+
+    def stats(self) -> Dict[str, Any]:
+        """구독자 수 및 목적지별 버전 반환"""
+        return {
+            "subscribers": {destination: len(queues) for destination, queues in self._subscribers.items()},
+            "versions": dict(self._versions),
+            "published": self.published
+        }
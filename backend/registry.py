@@ -0,0 +1,134 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+
+class UnknownDestinationError(Exception):
+    """등록되지 않은 목적지 요청"""
+
+
+def estimate_size(obj: Any) -> int:
+    """데이터셋이 차지하는 메모리를 대략적으로 계산 (bytes)"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, pd.DataFrame):
+            total += int(item.memory_usage(deep=True).sum())
+            continue
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__'):
+            stack.append(vars(item))
+    return total
+
+
+class DatasetRegistry:
+    """목적지별 데이터셋을 처음 사용할 때 로드하고, 메모리 예산을 넘으면 가장 오래 안 쓴 것부터 해제 (LRU)"""
+
+    def __init__(self, loader: Callable[[str], Dict[str, Any]], destinations: Iterable[str],
+                 budget_bytes: int):
+        self._loader = loader
+        self._destinations = set(destinations)
+        self.budget_bytes = budget_bytes
+        self._resident: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        # 전역 락은 LRU 목록/크기 관리에만 사용하고, 로드는 목적지별 락으로 직렬화
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.RLock] = {}
+        self.loads = 0
+        self.evictions = 0
+
+    @property
+    def destinations(self):
+        return sorted(self._destinations)
+
+    def register(self, destination: str):
+        """새 목적지 등록 (데이터는 첫 요청 시 로드)"""
+        with self._lock:
+            self._destinations.add(destination)
+
+    def destination_lock(self, destination: str) -> threading.RLock:
+        """목적지별 로드 락 (같은 목적지의 로드/재로드/갱신을 직렬화)"""
+        with self._lock:
+            if destination not in self._destinations:
+                raise UnknownDestinationError(f"알 수 없는 목적지: {destination}")
+            return self._load_locks.setdefault(destination, threading.RLock())
+
+    def get(self, destination: str) -> Dict[str, Any]:
+        """목적지 데이터셋 반환 (메모리에 없으면 로드)"""
+        with self._lock:
+            if destination in self._resident:
+                self._resident.move_to_end(destination)
+                return self._resident[destination]
+        # 다른 목적지 요청을 막지 않도록 전역 락 밖에서 로드
+        with self.destination_lock(destination):
+            with self._lock:
+                if destination in self._resident:
+                    self._resident.move_to_end(destination)
+                    return self._resident[destination]
+            return self._load(destination)
+
+    def peek(self, destination: str) -> Optional[Dict[str, Any]]:
+        """메모리에 있는 데이터셋 반환 (로드하거나 LRU 순서를 바꾸지 않음)"""
+        with self._lock:
+            return self._resident.get(destination)
+
+    def reload(self, destination: str) -> Dict[str, Any]:
+        """목적지 데이터셋을 다시 로드하여 교체 (로드 중에는 기존 데이터셋으로 계속 응답)"""
+        with self.destination_lock(destination):
+            return self._load(destination)
+
+    def replace(self, destination: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """갱신된 데이터셋으로 교체 (참조 하나만 바꾸므로 요청은 이전 또는 새 데이터셋 전체를 봄)"""
+        # 호출자가 목적지 락을 잡고 있음 - 크기 계산은 전역 락 없이 수행
+        size = estimate_size(data)
+        with self._lock:
+            self._resident[destination] = data
+            self._resident.move_to_end(destination)
+            self._sizes[destination] = size
+            self._evict(keep=destination)
+        return data
+
+    def _load(self, destination: str) -> Dict[str, Any]:
+        # 호출자가 목적지 락을 잡고 있음 - 로드는 전역 락 없이 수행
+        data = self._loader(destination)
+        with self._lock:
+            self.loads += 1
+        return self.replace(destination, data)
+
+    def _drop(self, destination: str):
+        self._resident.pop(destination, None)
+        self._sizes.pop(destination, None)
+
+    def _evict(self, keep: str):
+        # 방금 사용한 데이터셋은 예산을 넘더라도 유지 (요청 처리에 필요)
+        while sum(self._sizes.values()) > self.budget_bytes and len(self._resident) > 1:
+            oldest = next(iter(self._resident))
+            if oldest == keep:
+                break
+            self._drop(oldest)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """상주 데이터셋 및 메모리 사용량 반환"""
+        with self._lock:
+            return {
+                "destinations": self.destinations,
+                "resident": list(self._resident.keys()),
+                "resident_bytes": sum(self._sizes.values()),
+                "budget_bytes": self.budget_bytes,
+                "loads": self.loads,
+                "evictions": self.evictions
+            }
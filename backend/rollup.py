@@ -0,0 +1,136 @@
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+# 집계 단위: 월, 분기, 연도, 월별 계절 패턴(연도 무관 1-12월)
+GRANULARITIES = ('month', 'quarter', 'year', 'month_of_year')
+# 집계 지표: argmax/argmin은 최대/최소값을 기록한 월(1-12)
+MEASURES = ('sum', 'mean', 'min', 'max', 'argmax', 'argmin', 'count')
+
+def _prepare_rows(rows: Iterable[Dict[str, Any]], markets: List[str]) -> pd.DataFrame:
+    """월별 레코드를 집계용 DataFrame으로 변환하고 집계 키 컬럼 추가"""
+    df = pd.DataFrame(list(rows), columns=['year', 'month', 'month_str'] + markets)
+    # 결측값은 load_real_data와 동일하게 0으로 처리 (전부 NaN인 그룹의 idxmax 오류 방지)
+    df[markets] = df[markets].astype(float).fillna(0)
+    df['quarter'] = df['year'].astype(str) + '-Q' + ((df['month'] - 1) // 3 + 1).astype(str)
+    df['month_of_year'] = df['month']
+    return df
+
+class RollupCube:
+    """(집계 단위) x (시장) x (지표) 사전 집계 큐브 - 조회는 O(1) 딕셔너리 접근"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], markets: List[str]):
+        self.markets = list(markets)
+        self._rows = _prepare_rows(rows, self.markets)
+        self._cells: Dict[str, Dict[Any, Dict[str, Dict[str, float]]]] = {
+            granularity: {} for granularity in GRANULARITIES
+        }
+        # 연도별 월 키 인덱스 (월 셀을 연도 단위로 바로 조회)
+        self._months_by_year: Dict[int, List[str]] = {}
+        for granularity in GRANULARITIES:
+            self._aggregate(granularity, self._rows)
+
+    def _key_column(self, granularity: str) -> str:
+        return 'month_str' if granularity == 'month' else granularity
+
+    def _aggregate(self, granularity: str, rows: pd.DataFrame):
+        """주어진 행들이 속한 그룹의 셀을 벡터화된 groupby로 다시 계산"""
+        if rows.empty:
+            return
+        grouped = rows.groupby(self._key_column(granularity))[self.markets]
+        measures = {
+            'sum': grouped.sum(),
+            'mean': grouped.mean(),
+            'min': grouped.min(),
+            'max': grouped.max(),
+            # idxmax/idxmin은 행 인덱스를 반환하므로 해당 행의 월 번호로 변환
+            'argmax': grouped.idxmax().apply(lambda col: rows.loc[col, 'month'].values),
+            'argmin': grouped.idxmin().apply(lambda col: rows.loc[col, 'month'].values),
+        }
+        counts = grouped.size()
+
+        cells = self._cells[granularity]
+        for key in counts.index:
+            cell_key = int(key) if granularity in ('year', 'month_of_year') else key
+            cells[cell_key] = {
+                market: {
+                    **{measure: (int(frame.at[key, market]) if measure in ('argmax', 'argmin')
+                                 else float(frame.at[key, market]))
+                       for measure, frame in measures.items()},
+                    'count': int(counts[key])
+                }
+                for market in self.markets
+            }
+            if granularity == 'month':
+                year_months = self._months_by_year.setdefault(int(key[:4]), [])
+                if key not in year_months:
+                    year_months.append(key)
+                    year_months.sort()
+
+    def copy(self) -> 'RollupCube':
+        """증분 갱신용 사본 (셀은 통째로 교체되므로 셀 값은 공유하고 인덱스만 복사)"""
+        clone = RollupCube.__new__(RollupCube)
+        clone.markets = list(self.markets)
+        clone._rows = self._rows
+        clone._cells = {granularity: dict(cells) for granularity, cells in self._cells.items()}
+        clone._months_by_year = {year: list(months) for year, months in self._months_by_year.items()}
+        return clone
+
+    def append(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """새 기간 데이터를 추가하고 영향받는 셀만 재계산 (같은 월은 새 값으로 교체)"""
+        new_rows = _prepare_rows(rows, self.markets)
+        if new_rows.empty:
+            return {granularity: [] for granularity in GRANULARITIES}
+
+        combined = pd.concat([self._rows, new_rows], ignore_index=True)
+        # 시간순 정렬 유지 (argmax/argmin 동률 시 전체 재집계와 같은 월 선택)
+        self._rows = (combined.drop_duplicates('month_str', keep='last')
+                      .sort_values('month_str').reset_index(drop=True))
+
+        changed = {}
+        for granularity in GRANULARITIES:
+            key_column = self._key_column(granularity)
+            affected = new_rows[key_column].unique()
+            self._aggregate(granularity, self._rows[self._rows[key_column].isin(affected)])
+            changed[granularity] = sorted(int(key) if granularity in ('year', 'month_of_year') else key
+                                          for key in affected)
+        return changed
+
+    def get(self, granularity: str, period: Any, market: str, measure: str) -> Optional[float]:
+        """단일 셀 값 조회 (없으면 None)"""
+        cell = self._cells[granularity].get(period)
+        if cell is None:
+            return None
+        return cell[market][measure]
+
+    def cell(self, granularity: str, period: Any) -> Dict[str, Dict[str, float]]:
+        """해당 기간의 시장별 전체 지표 조회"""
+        return self._cells[granularity].get(period, {})
+
+    def months_in_year(self, year: int) -> List[str]:
+        """해당 연도의 월 키 목록 ('YYYY-MM', 정렬)"""
+        return list(self._months_by_year.get(year, []))
+
+    def month_records(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
+        """월 셀을 월별 레코드 형태로 반환 (year 지정 시 해당 연도만)"""
+        month_keys = self.months_in_year(year) if year is not None else self.periods('month')
+        records = []
+        for key in month_keys:
+            cell = self._cells['month'][key]
+            records.append({
+                'year': int(key[:4]),
+                'month': int(key[5:7]),
+                'month_str': key,
+                **{market: cell[market]['sum'] for market in self.markets}
+            })
+        return records
+
+    def periods(self, granularity: str) -> List[Any]:
+        """집계된 기간 키 목록 (정렬)"""
+        return sorted(self._cells[granularity].keys())
+
+    def series(self, granularity: str, market: str, measure: str,
+               periods: Optional[Iterable[Any]] = None) -> pd.Series:
+        """기간별 지표 값을 Series로 반환"""
+        cells = self._cells[granularity]
+        keys = self.periods(granularity) if periods is None else [p for p in periods if p in cells]
+        return pd.Series({key: cells[key][market][measure] for key in keys}, dtype=float)
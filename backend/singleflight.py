@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Callable, Dict, Hashable
+
+from starlette.concurrency import run_in_threadpool
+
+
+def _retrieve_exception(task: asyncio.Future):
+    # 대기 요청이 모두 취소된 계산의 예외를 회수 ("exception was never retrieved" 경고 방지)
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    """동일한 키의 동시 요청을 하나의 계산으로 합쳐 결과를 공유 (single-flight)"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0   # 실제로 실행된 계산 횟수
+        self.coalesced = 0  # 진행 중인 계산에 합쳐진 요청 횟수
+
+    async def _run(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        try:
+            if asyncio.iscoroutinefunction(func):
+                return await func(*args)
+            # 동기 분석 함수는 스레드풀에서 실행하여 이벤트 루프를 막지 않음
+            return await run_in_threadpool(func, *args)
+        finally:
+            # 계산이 끝나는 즉시 제거 - 이후 요청은 끝난 결과를 공유하지 않고 새로 실행
+            self._inflight.pop(key, None)
+
+    async def do(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        """key에 해당하는 계산이 진행 중이면 그 결과를 기다리고, 아니면 새로 실행"""
+        task = self._inflight.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(self._run(key, func, *args))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        # 한 요청이 취소되어도 다른 대기 요청의 계산은 계속되도록 shield 사용
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            task.add_done_callback(_retrieve_exception)
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        """합쳐진 요청 / 실행된 계산 카운터 반환"""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight)
+        }
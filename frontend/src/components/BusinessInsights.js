@@ -1,27 +1,28 @@
 import React, { useState, useEffect } from 'react';
 import { Alert, Badge, Card, Row, Col, ListGroup } from 'react-bootstrap';
+import { useDatasetEvents, noticeAffectsPeriod } from '../datasetEvents';
 
-const BusinessInsights = ({ viewMode = 'yearly' }) => {
+const BusinessInsights = ({ viewMode = 'yearly', selectedYear = 'all' }) => {
   const [insights, setInsights] = useState(null);
   const [loading, setLoading] = useState(true);
+  // 데이터 재로드 알림으로 다시 조회할 때마다 증가
+  const [dataVersion, setDataVersion] = useState(0);
 
   useEffect(() => {
     const fetchInsights = async () => {
       try {
         setLoading(true);
         
-        // 실제 API에서 데이터 가져오기
-        const [rankingsResponse, monthlyResponse] = await Promise.all([
-          fetch('http://localhost:8000/api/rankings'),
-          fetch('http://localhost:8000/api/monthly')
-        ]);
-        
-        const rankingsData = await rankingsResponse.json();
-        const monthlyData = await monthlyResponse.json();
+        // 서버에서 사전 계산된 인사이트 가져오기
+        const response = await fetch(`http://localhost:8000/api/insights?year=${selectedYear}`);
+        if (!response.ok) {
+          throw new Error(`인사이트 API 오류: ${response.status}`);
+        }
+        const insightsData = await response.json();
         
         // 실제 데이터 기반 인사이트 생성
-        const topCountries = rankingsData.rankings.slice(0, 3);
-        const seasonality = monthlyData.seasonality || {};
+        const topCountries = insightsData.target_markets;
+        const seasonality = insightsData.summary || {};
         
         const insightData = {
           yearly: {
@@ -145,7 +146,14 @@ const BusinessInsights = ({ viewMode = 'yearly' }) => {
     };
 
     fetchInsights();
-  }, [viewMode]);
+  }, [viewMode, selectedYear, dataVersion]);
+
+  // 데이터 재로드로 선택한 기간의 인사이트가 다시 계산되면 다시 조회
+  useDatasetEvents((notice) => {
+    if (noticeAffectsPeriod(notice, selectedYear)) {
+      setDataVersion((version) => version + 1);
+    }
+  });
 
   const getUrgencyColor = (urgency) => {
     switch (urgency) {
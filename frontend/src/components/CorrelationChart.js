@@ -10,11 +10,14 @@ import {
   Tooltip,
   Legend
 } from 'recharts';
+import { useDatasetEvents, noticeAffectsPeriod } from '../datasetEvents';
 
 const CorrelationChart = ({ selectedYear, filterYear }) => {
   const [correlationData, setCorrelationData] = useState([]);
   const [analysisType, setAnalysisType] = useState('yearly');
   const [loading, setLoading] = useState(true);
+  // 데이터 재로드 알림으로 다시 조회할 때마다 증가
+  const [dataVersion, setDataVersion] = useState(0);
 
   useEffect(() => {
     const fetchCorrelations = async () => {
@@ -45,7 +48,14 @@ const CorrelationChart = ({ selectedYear, filterYear }) => {
     };
 
     fetchCorrelations();
-  }, [selectedYear, filterYear]);
+  }, [selectedYear, filterYear, dataVersion]);
+
+  // 데이터 재로드로 선택한 기간의 데이터가 바뀌면 상관관계 다시 조회
+  useDatasetEvents((notice) => {
+    if (noticeAffectsPeriod(notice, selectedYear)) {
+      setDataVersion((version) => version + 1);
+    }
+  });
 
   // 국가별 색상 매핑
   const countryColors = {
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { Card, Alert, Row, Col, Badge, ProgressBar } from 'react-bootstrap';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
+import { useDatasetEvents, noticeAffectsPeriod } from '../datasetEvents';
 
 function CountryRankingChart({ selectedYear, filterYear }) {
   const [rankingData, setRankingData] = useState(null);
@@ -11,6 +12,13 @@ function CountryRankingChart({ selectedYear, filterYear }) {
     fetchRankingData();
   }, [selectedYear, filterYear]);
 
+  // 데이터 재로드로 선택한 기간의 데이터가 바뀌면 순위 다시 조회
+  useDatasetEvents((notice) => {
+    if (noticeAffectsPeriod(notice, selectedYear)) {
+      fetchRankingData();
+    }
+  });
+
   const fetchRankingData = async () => {
     try {
       setLoading(true);
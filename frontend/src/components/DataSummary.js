@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Row, Col, Card, Alert, Badge } from 'react-bootstrap';
+import { useDatasetEvents, noticeAffectsPeriod } from '../datasetEvents';
 
 const DataSummary = ({ selectedYear, filterYear }) => {
   const [summaryData, setSummaryData] = useState(null);
@@ -10,6 +11,13 @@ const DataSummary = ({ selectedYear, filterYear }) => {
     fetchData();
   }, [selectedYear, filterYear]);
 
+  // 데이터 재로드로 선택한 기간의 데이터가 바뀌면 요약 다시 조회
+  useDatasetEvents((notice) => {
+    if (noticeAffectsPeriod(notice, selectedYear)) {
+      fetchData();
+    }
+  });
+
   const fetchData = async () => {
     try {
       setLoading(true);
@@ -12,6 +12,7 @@ import {
   BarChart,
   Bar
 } from 'recharts';
+import { useDatasetEvents, noticeAffectsPeriod } from '../datasetEvents';
 
 function MonthlyTrends({ selectedYear, filterYear }) {
   const [trendsData, setTrendsData] = useState(null);
@@ -25,6 +26,31 @@ function MonthlyTrends({ selectedYear, filterYear }) {
     fetchData();
   }, [selectedYear, filterYear]);
 
+  // 데이터 재로드 알림을 받으면 전체 재조회 대신 변경분만 반영
+  useDatasetEvents((notice) => {
+    if (notice.full_refresh) {
+      fetchData();
+      return;
+    }
+    setTrendsData((currentTrends) => patchTrends(currentTrends, notice, selectedYear));
+    // 알림에 상관계수는 없으므로 해당 기간 데이터가 바뀐 경우 상관관계만 다시 조회
+    if (noticeAffectsPeriod(notice, selectedYear)) {
+      fetchCorrelations();
+    }
+  });
+
+  const fetchCorrelations = async () => {
+    try {
+      const response = await fetch(`http://localhost:8000/api/correlations?year=${selectedYear}`);
+      if (response.ok) {
+        const data = await response.json();
+        setCorrelationData(data.correlations || {});
+      }
+    } catch (err) {
+      console.error('상관관계 데이터 갱신 오류:', err);
+    }
+  };
+
   const fetchData = async () => {
     try {
       setLoading(true);
@@ -104,6 +130,41 @@ function MonthlyTrends({ selectedYear, filterYear }) {
 
 
 
+  const patchTrends = (currentTrends, notice, year) => {
+    if (!currentTrends) return currentTrends;
+
+    if (year === 'all') {
+      // 전체 기간: 변경된 연도 집계 교체
+      const byYear = new Map(currentTrends.map(entry => [String(entry.year), entry]));
+      Object.entries(notice.yearly || {}).forEach(([yearKey, entry]) => {
+        byYear.set(yearKey, { ...byYear.get(yearKey), ...entry, year: parseInt(yearKey) });
+      });
+      return Array.from(byYear.values()).sort((a, b) => a.year - b.year);
+    }
+
+    // 특정 연도: 추가/변경/삭제된 월만 반영
+    const yearNum = parseInt(year);
+    const byMonth = new Map(currentTrends.map(entry => [entry.month, entry]));
+    (notice.removed_months || []).forEach(monthKey => byMonth.delete(monthKey));
+    [...(notice.appended_months || []), ...(notice.changed_months || [])]
+      .filter(monthData => monthData.year === yearNum)
+      .forEach(monthData => {
+        byMonth.set(monthData.month_str, {
+          month: monthData.month_str,
+          monthNumber: monthData.month,
+          japan: monthData.japan || 0,
+          korea: monthData.korea || 0,
+          usa: monthData.usa || 0,
+          china: monthData.china || 0,
+          philippines: monthData.philippines || 0,
+          taiwan: monthData.taiwan || 0,
+          total: (monthData.japan || 0) + (monthData.korea || 0) + (monthData.usa || 0) + 
+                 (monthData.china || 0) + (monthData.philippines || 0) + (monthData.taiwan || 0)
+        });
+      });
+    return Array.from(byMonth.values()).sort((a, b) => a.monthNumber - b.monthNumber);
+  };
+
   const getCountryColor = (country) => {
     const colors = {
       japan: '#FF6B6B',
@@ -0,0 +1,68 @@
+import { useEffect, useRef } from 'react';
+
+// 데이터셋 변경 알림(SSE) 구독 - 모든 컴포넌트가 하나의 연결을 공유
+const EVENTS_URL = 'http://localhost:8000/api/events';
+// 브라우저가 재연결을 포기한 경우(연결 종료) 다시 연결하기까지 대기 시간 (ms)
+const RECONNECT_DELAY_MS = 15000;
+
+let eventSource = null;
+let lastVersion = null;
+const listeners = new Set();
+
+function connect() {
+  // 마지막으로 받은 버전을 전달하면 서버가 놓친 알림이 있을 때 전체 재조회 알림을 보냄
+  const url = lastVersion === null ? EVENTS_URL : `${EVENTS_URL}?version=${lastVersion}`;
+  eventSource = new EventSource(url);
+  eventSource.addEventListener('dataset-version', (event) => {
+    const notice = JSON.parse(event.data);
+    // 버전이 이어지지 않으면(알림 유실, 서버 재시작) 변경분 대신 전체 재조회
+    const missed = lastVersion !== null && notice.version !== lastVersion + 1;
+    lastVersion = notice.version;
+    const delivered = missed ? { ...notice, full_refresh: true } : notice;
+    listeners.forEach((callback) => callback(delivered));
+  });
+  eventSource.addEventListener('error', () => {
+    if (eventSource.readyState === EventSource.CLOSED) {
+      setTimeout(connect, RECONNECT_DELAY_MS);
+    }
+  });
+}
+
+export function subscribeDatasetEvents(listener) {
+  listeners.add(listener);
+
+  // 연결은 구독자 수와 무관하게 유지 (연도 전환 등으로 구독이 바뀌어도 알림 유실 없음)
+  if (!eventSource) {
+    connect();
+  }
+
+  // 구독 해제 함수 반환
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+// 알림이 해당 기간(전체 또는 특정 연도)의 데이터를 바꾸는지 확인
+export function noticeAffectsPeriod(notice, year) {
+  if (notice.full_refresh) {
+    return true;
+  }
+  const changedMonths = [...(notice.appended_months || []), ...(notice.changed_months || [])];
+  const removedMonths = notice.removed_months || [];
+  const changedYears = Object.keys(notice.yearly || {});
+  if (year === 'all') {
+    return changedMonths.length > 0 || removedMonths.length > 0 || changedYears.length > 0;
+  }
+  const yearNum = parseInt(year);
+  return changedMonths.some(monthData => monthData.year === yearNum) ||
+    removedMonths.some(monthKey => parseInt(monthKey.slice(0, 4)) === yearNum) ||
+    changedYears.includes(String(yearNum));
+}
+
+// 컴포넌트 수명 동안 한 번만 구독하고, 알림은 항상 최신 props를 보는 콜백으로 전달
+export function useDatasetEvents(listener) {
+  const listenerRef = useRef(listener);
+  listenerRef.current = listener;
+
+  useEffect(() => subscribeDatasetEvents((notice) => listenerRef.current(notice)), []);
+}